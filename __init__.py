@@ -5,6 +5,7 @@ FortiParse - A Python library to parse FortiGate configuration files into JSON f
 from .fortiparse import (
     FortiParser,
     parse_file,
+    parse_files,
     parse_text,
     main
 )
@@ -12,6 +13,7 @@ from .fortiparse import (
 __all__ = [
     'FortiParser',
     'parse_file',
+    'parse_files',
     'parse_text',
     'main'
 ]
\ No newline at end of file
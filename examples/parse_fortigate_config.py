@@ -11,6 +11,8 @@ This script:
 
 import os
 import sys
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path to import fortiparse
@@ -60,6 +62,22 @@ def parse_and_analyze_config(config_file):
         print(f"  - Hostname: {hostname}")
         print(f"  - Timezone: {timezone}")
 
+    # Interfaces and their addresses
+    print("\nInterfaces:")
+    for interface in parser.iter_interfaces():
+        print(f"  - {interface['name']}: {interface.get('ip', 'No IP')}")
+
+    # Show the first few policies, then count actions across all of them;
+    # both stream over the parsed policies without building a list
+    print("\nFirst policies:")
+    for policy in islice(parser.iter_policies(), 3):
+        print(format_policy(policy))
+
+    actions = Counter(policy.get("action", "Unknown") for policy in parser.iter_policies())
+    print("\nPolicy actions:")
+    for action, count in actions.items():
+        print(f"  - {action}: {count}")
+
     # Save the full JSON for reference
     output_file = os.path.basename(config_file) + ".json"
     parser.save_json(output_file)
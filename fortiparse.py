@@ -5,14 +5,457 @@ This module provides a simple interface to convert FortiGate configurations into
 structured JSON objects that can be easily manipulated with Python.
 """
 
+import functools
 import json
+import mmap
+import multiprocessing
+import os
 import re
-from typing import Dict, Optional, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Matches each quoted item in a multi-value set line (e.g. member lists)
+_QUOTED_LIST_RE = re.compile(r'"([^"]*)"')
+
+# Matches an escaped backslash or quote inside a quoted value
+_ESCAPE_RE = re.compile(r'\\([\\"])')
+
+# Set values up to this length are interned, so the few distinct short
+# values (e.g. "enable", "accept", "root") each exist once in memory
+_INTERN_MAX_LEN = 24
+
+# Matches one statement line (after any indentation). A set line captures
+# its key and raw value directly, other keywords capture the rest of the line.
+# Neighbouring pieces of each alternative match disjoint character classes
+# (or run to the end of the line), so matching never backtracks and the scan
+# stays linear however many quotes or backslashes a line holds; the same
+# holds for _BLOCK_RE, _QUOTED_LIST_RE and _ESCAPE_RE
+_TOKEN_RE = re.compile(
+    r"""
+    ^[^\S\n]*
+    (?:
+        set\ [^\S\n]*(\S+)(?:[^\S\n]+([^\n]*))?
+      | (config|edit|unset)\ ([^\n]*)
+      | (next|end)[^\S\n]*$
+    )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Matches the lines _split_top_level() needs to track block depth: block
+# openers, block closers, and set lines with an odd number of quotes (which
+# start a multiline value)
+_BLOCK_RE = re.compile(
+    r"""
+    ^[^\S\n]*
+    (?:
+        (config|edit)\ [^\S\n]*\S
+      | (next|end)[^\S\n]*$
+      | set\ (?:[^"\n]*"[^"\n]*")*[^"\n]*"[^"\n]*$
+    )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+
+def _parse_into(text, root):
+    """
+    Parse FortiGate configuration text into a nested dict.
+
+    Lexing and tree building happen in a single pass: each statement is
+    applied to the current section as soon as it is matched, so no token
+    stream or per-line tuples are ever built. Multiline quoted values are
+    joined here, and set values are unquoted or split into lists.
+
+    Args:
+        text: FortiGate configuration text
+        root: Dict to build the configuration into
+
+    Returns:
+        True if every config/edit block was closed and no next/end went
+        past the root, i.e. the text formed complete top-level blocks
+    """
+    # The section stack is preallocated and tracked with an explicit top
+    # index, so pushes and pops are plain assignments; slot 0 is the root
+    current_section = root
+    section_stack = [None] * 64
+    section_stack[0] = current_section
+    top = 0
+    balanced = True
+    skip_to = 0  # Statement lines before this offset were part of a multiline value
+    intern = sys.intern
+
+    # A single regex scan finds every statement line; blank lines, comments
+    # and unknown statements never match and cost no Python-level work
+    for match in _TOKEN_RE.finditer(text):
+        if match.start() < skip_to:
+            continue
+
+        key, raw_value, head, rest, bare = match.groups()
+
+        # Handle "set" statements (by far the most common, so tested first)
+        if key is not None:
+            raw_value = raw_value.rstrip() if raw_value else ""
+
+            # Count quotes once; unquoted values (most of them) skip the count
+            quotes = raw_value.count('"') if '"' in raw_value else 0
+
+            # Check if this is a multiline quoted string
+            if quotes % 2 != 0:  # Odd number of quotes means unclosed quote
+                # Collect the following lines up to the closing quote
+                lines, skip_to = _read_continuation(text, match.end())
+                raw_value = "\n".join([raw_value] + lines)
+                quotes = raw_value.count('"')
+
+            # Keys and short values repeat across the whole config, so
+            # share one str object for each instead of a copy per line
+            value = _parse_value(raw_value, quotes)
+            if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+                value = intern(value)
+            current_section[intern(key)] = value
+            continue
+
+        # Handle "next" and "end" - go back up one level, never past the root
+        if bare is not None:
+            if top:
+                top -= 1
+                current_section = section_stack[top]
+            else:
+                balanced = False
+            continue
+
+        # The rest of the line is left unstripped: split() ignores the
+        # surrounding whitespace anyway, so only edit needs to trim it
+
+        # Handle "edit" statements
+        if head == 'edit':
+            # Drop one optional opening quote, then take everything up to
+            # the next quote (e.g. 'edit "port1"' -> 'port1')
+            edit_key = rest.strip()
+            if edit_key[:1] == '"':
+                edit_key = edit_key[1:]
+            edit_key = edit_key.partition('"')[0]
+            if not edit_key:
+                continue
+
+            # Get or create the section's edit dict, then this entry's dict,
+            # with a single lookup each. Edit names are interned like all
+            # keys: they recur as set values (e.g. interface and address
+            # names referenced by policies)
+            edits = current_section.setdefault("edit", {})
+            current_section = edits.setdefault(intern(edit_key), {})
+
+        # Handle config section starts (e.g., "system interface")
+        elif head == 'config':
+            section_parts = rest.split()
+            if not section_parts:
+                continue
+
+            # For proper nesting, create or get each level of the section
+            # path; most are two words, so that case is unrolled. Section
+            # names repeat in every block, so they are interned too
+            if len(section_parts) == 2:
+                current_section = current_section.setdefault(
+                    intern(section_parts[0]), {}).setdefault(intern(section_parts[1]), {})
+            else:
+                for part in section_parts:
+                    current_section = current_section.setdefault(intern(part), {})
+
+        # Handle "unset" statements
+        else:
+            key_value = rest.split(None, 1)
+            if key_value:
+                current_section[intern(key_value[0])] = None
+            continue
+
+        # Push the section we just entered
+        top += 1
+        if top == len(section_stack):
+            section_stack.append(current_section)
+        else:
+            section_stack[top] = current_section
+
+    return balanced and top == 0
+
+
+def _read_continuation(text, pos):
+    """
+    Collect the continuation lines of a multiline quoted value.
+
+    Args:
+        text: FortiGate configuration text
+        pos: Offset of the newline ending the line that opened the quote
+
+    Returns:
+        Tuple of (stripped continuation lines, offset of the newline ending
+        the last consumed line)
+    """
+    lines = []
+
+    # Continue collecting lines until we find the closing quote
+    while pos + 1 < len(text):
+        end = text.find('\n', pos + 1)
+        if end < 0:
+            end = len(text)
+        next_line = text[pos + 1:end].strip()
+        lines.append(next_line)
+        pos = end
+
+        # If we find a closing quote not preceded by a backslash, we're done
+        if '"' in next_line and next_line.endswith('"') and not next_line.endswith('\\"'):
+            break
+
+    return lines, pos
+
+
+def _parse_value(raw_value, quotes):
+    """
+    Convert the raw text of a set statement into its stored value.
+
+    Args:
+        raw_value: Everything after the set key, multiline values included
+        quotes: Number of double quote characters in raw_value
+
+    Returns:
+        A list for multi-value quoted strings, otherwise the unquoted string
+    """
+    # Check if this is a multi-value quoted string (like member lists)
+    if quotes >= 4 and ' "' in raw_value and '\\"' not in raw_value:
+        # This appears to be a list of quoted items
+        # We'll parse and rebuild it as a list
+        matches = _QUOTED_LIST_RE.findall(raw_value)
+
+        if matches:
+            # Store as a list if we found multiple quoted strings
+            return matches
+
+        # Fallback: store as is if the regex didn't match
+        return raw_value
+
+    # Handle regular single-value with or without quotes
+    value = raw_value
+
+    # Process quoted values with possible escape sequences
+    if value[:1] == '"' == value[-1:]:
+        # Extract the content between quotes
+        quoted_content = value[1:-1]
+
+        # Handle escape sequences properly: \\ becomes \ and \" becomes ",
+        # in a single left-to-right pass; other backslashes are kept as is
+        if '\\' in quoted_content:
+            quoted_content = _ESCAPE_RE.sub(r'\1', quoted_content)
+
+        value = quoted_content
+    elif value[:1] == "'" == value[-1:]:
+        # Simple single quotes without escaping
+        value = value[1:-1]
+
+    return value
+
+
+def _split_top_level(text, count):
+    """
+    Split configuration text into roughly equal runs of top-level blocks.
+
+    Only structural lines are looked at, so this is much cheaper than a full
+    tokenize. Multiline quoted values are skipped the same way _parse_into()
+    skips them.
+
+    Args:
+        text: FortiGate configuration text
+        count: Desired number of chunks
+
+    Returns:
+        List of text chunks, each ending on a top-level "end" (except the last)
+    """
+    chunks = []
+    start = 0
+    target = len(text) // count
+    depth = 0
+    skip_to = 0
+
+    for match in _BLOCK_RE.finditer(text):
+        if match.start() < skip_to:
+            continue
+
+        opener, closer = match.groups()
+        if opener is not None:
+            depth += 1
+        elif closer is not None:
+            if depth:
+                depth -= 1
+            if depth == 0 and match.end() - start >= target:
+                chunks.append(text[start:match.end()])
+                start = match.end()
+        else:
+            # A set value that opens a multiline quoted string
+            skip_to = _read_continuation(text, match.end())[1]
+
+    chunks.append(text[start:])
+    return chunks
+
+
+def _parse_chunk(text):
+    """
+    Parse one chunk of top-level blocks in a worker process.
+
+    Args:
+        text: FortiGate configuration text
+
+    Returns:
+        Tuple of (parsed dict, whether the chunk was made of complete blocks)
+    """
+    root = {}
+    balanced = _parse_into(text, root)
+    return root, balanced
+
+
+def _merge_sections(target, source):
+    """
+    Merge a parsed chunk into the configuration parsed so far.
+
+    Nested sections are merged key by key and later values win, which is
+    what parsing the chunks one after another would have produced.
+
+    Args:
+        target: Configuration parsed from the earlier chunks, updated in place
+        source: Configuration parsed from the next chunk
+    """
+    for key, value in source.items():
+        existing = target.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge_sections(existing, value)
+        else:
+            target[key] = value
+
+
+def _parse_parallel(text, processes):
+    """
+    Parse top-level configuration blocks in a pool of worker processes.
+
+    Workers intern strings as usual, but the parent gets unpickled copies:
+    each string is shared within its chunk only and is not interned in this
+    process.
+
+    Args:
+        text: FortiGate configuration text
+        processes: Number of worker processes
+
+    Returns:
+        The parsed configuration, or None if the text did not split into
+        more than one chunk of complete top-level blocks
+    """
+    chunks = _split_top_level(text, processes)
+    if len(chunks) < 2:
+        return None
+
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(_parse_chunk, chunks)
+
+    if not all(balanced for _, balanced in results):
+        return None
+
+    config_json = {}
+    for chunk_json, _ in results:
+        _merge_sections(config_json, chunk_json)
+    return config_json
+
+
+def _copy_tree(node: Any) -> Any:
+    """
+    Copy a parsed configuration tree.
+
+    Parsed trees only hold dicts, lists of strings, strings and None, so this
+    is much cheaper than copy.deepcopy().
+
+    Args:
+        node: A parsed configuration dict or one of its values
+
+    Returns:
+        An independent copy of node
+    """
+    if isinstance(node, dict):
+        return {key: _copy_tree(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return node[:]
+    return node
+
+
+def _read_config_file(config_file: str) -> str:
+    """
+    Read a configuration file into a string.
+
+    The file is memory-mapped and decoded straight from the mapping, so no
+    intermediate bytes copy of the whole file is held alongside the str.
+
+    Args:
+        config_file: Path to FortiGate configuration file
+
+    Returns:
+        The decoded file contents with line endings normalized to '\\n'
+    """
+    with open(config_file, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and other unmappable inputs are read normally
+            text = f.read().decode('utf-8')
+        else:
+            with mapped:
+                text = str(mapped, 'utf-8')
+
+    # Match text-mode universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+    """
+    Serialize data with orjson if it is installed and matches the json module.
+
+    For the trees the parser produces (dicts, lists, strings and None),
+    orjson's 2-space output is identical to json.dumps(data, indent=2) as
+    long as no string holds a non-ASCII character or DEL. Anything else
+    returns None and the caller falls back to the json module, so output of
+    such trees never depends on whether orjson is installed: those
+    characters are always \\u-escaped as with json's ensure_ascii, and
+    compact output (indent=None) keeps json's ", " and ": " separators,
+    which orjson cannot emit. Data orjson rejects (lone surrogates, very
+    deep nesting, non-str keys, ints over 64 bits) also falls back; floats
+    added by the caller may be formatted differently.
+
+    Args:
+        data: Object to serialize
+        indent: Requested indentation, as for json.dumps
+
+    Returns:
+        UTF-8 encoded JSON, or None if orjson cannot be used
+    """
+    if not _HAS_ORJSON or indent != 2:
+        return None
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError:
+        return None
+    if not encoded.isascii() or b'\x7f' in encoded:
+        return None
+    return encoded
 
 
 class FortiParser:
     """Parser for FortiGate configuration files."""
 
+    # Fixed attribute set: no per-instance __dict__, and faster attribute access
+    __slots__ = ('config_text', 'config_json', '_parse_state', '_parsed')
+
     def __init__(self, config_text: Optional[str] = None, config_file: Optional[str] = None):
         """
         Initialize the FortiParser with either a string or file path.
@@ -27,217 +470,124 @@ class FortiParser:
         if config_text is not None:
             self.config_text = config_text
         elif config_file is not None:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self.config_text = f.read()
+            self.config_text = _read_config_file(config_file)
         else:
             raise ValueError("Either config_text or config_file must be provided")
 
         self.config_json = {}
         self._parse_state = []  # Used to track the current parsing level
+        self._parsed = False  # Set once parse() has run, even for an empty config
 
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, processes: Optional[int] = None, cache: bool = False) -> Dict[str, Any]:
         """
         Parse the FortiGate configuration into a JSON object.
         Handles multiline quoted strings.
 
+        Args:
+            processes: Number of worker processes to parse top-level config
+                blocks in parallel. Only worth it for very large configs
+                (e.g. merged multi-VDOM dumps); by default the whole config
+                is parsed in this process. Where workers are spawned
+                (Windows, and macOS by default), call this under an
+                if __name__ == "__main__": guard in the main script.
+                A parallel parse does not use the cache, and its strings
+                are only shared within each chunk, not interned.
+            cache: Reuse the parse of an identical config text from an
+                earlier parse(cache=True) call, by any instance, and keep
+                this one for later calls. Each call still returns its own
+                copy. Off by default, since the cache keeps both the text
+                and its parsed tree in memory until clear_cache(). Only
+                applies to in-process parses: when the config is split
+                between worker processes, the cache is neither consulted
+                nor filled.
+
         Returns:
             Dict containing the parsed configuration
         """
-        self.config_json = {}
         self._parse_state = []
 
-        lines = self.config_text.split('\n')
-        current_section = self.config_json
-        section_stack = [current_section]
-        path_stack = []  # Track the section path
+        config_json = None
+        if processes is not None and processes > 1:
+            config_json = _parse_parallel(self.config_text, processes)
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                i += 1
-                continue
-
-            # Handle config section starts
-            if line.startswith('config '):
-                # Extract section name (e.g., "system interface")
-                section_full_name = line[7:].strip()
-                section_parts = section_full_name.split()
-
-                # For proper nesting, we need to create hierarchical path
-                for part in section_parts:
-                    # Create or get the section if it doesn't exist
-                    if part not in current_section:
-                        current_section[part] = {}
+        # Parse in-process by default, or when the config could not be split
+        # into independent top-level blocks. Cached trees are shared, so
+        # callers only ever get a copy of one
+        if config_json is None:
+            if cache:
+                config_json = _copy_tree(_parse_text_cached(self.config_text))
+            else:
+                config_json = _parse_config_text(self.config_text)
 
-                    # Update current section and stack
-                    current_section = current_section[part]
-                    path_stack.append(part)
+        self.config_json = config_json
+        self._parsed = True
+        return self.config_json
 
-                # Update section stack with current section
-                section_stack.append(current_section)
-                i += 1
-                continue
+    def invalidate(self) -> None:
+        """
+        Discard this instance's parse result.
 
-            # Handle "edit" statements
-            if line.startswith('edit '):
-                key_match = re.match(r'edit\s+"?([^"]+)"?', line)
-                if key_match:
-                    edit_key = key_match.group(1)
-
-                    # Initialize empty dict for this edit block if not already set
-                    if "edit" not in current_section:
-                        current_section["edit"] = {}
-
-                    # Create nested dict for this edit key
-                    if edit_key not in current_section["edit"]:
-                        current_section["edit"][edit_key] = {}
-
-                    current_section = current_section["edit"][edit_key]
-                    section_stack.append(current_section)
-                    i += 1
-                    continue
-
-            # Handle "set" statements
-            if line.startswith('set '):
-                # First, extract the key
-                key_match = re.match(r'set\s+([^\s]+)(?:\s+(.*))?', line)
-                if key_match:
-                    key = key_match.group(1)
-                    raw_value = key_match.group(2) if key_match.group(2) else ""
-
-                    # Check if this is a multiline quoted string
-                    if raw_value.count('"') % 2 != 0:  # Odd number of quotes means unclosed quote
-                        # Start collecting the multiline string
-                        multiline_value = raw_value
-                        j = i + 1
-
-                        # Continue collecting lines until we find the closing quote
-                        while j < len(lines):
-                            next_line = lines[j].strip()
-                            multiline_value += "\n" + next_line
-
-                            # If we find a closing quote not preceded by a backslash, we're done
-                            if '"' in next_line and next_line.rstrip().endswith(
-                                    '"') and not next_line.rstrip().endswith('\\"'):
-                                break
-
-                            j += 1
-
-                        # Update raw_value with our collected multiline string
-                        raw_value = multiline_value
-                        i = j + 1  # Skip past the lines we've consumed
-                    else:
-                        i += 1
-
-                    # Check if this is a multi-value quoted string (like member lists)
-                    if ' "' in raw_value and raw_value.count('"') >= 4 and not raw_value.count('\\"'):
-                        # This appears to be a list of quoted items
-                        # We'll parse and rebuild it as a list
-                        quoted_pattern = re.compile(r'"([^"]*)"')
-                        matches = quoted_pattern.findall(raw_value)
-
-                        if matches:
-                            # Store as a list if we found multiple quoted strings
-                            current_section[key] = matches
-                        else:
-                            # Fallback: store as is if the regex didn't match
-                            current_section[key] = raw_value
-                    else:
-                        # Handle regular single-value with or without quotes
-                        value = raw_value
-
-                        # Process quoted values with possible escape sequences
-                        if (value.startswith('"') and value.endswith('"')):
-                            # Extract the content between quotes
-                            quoted_content = value[1:-1]
-
-                            # Handle escape sequences properly
-                            # Replace escaped quotes with temporary markers
-                            temp_quote = "__TEMP_QUOTE__"
-                            temp_backslash = "__TEMP_BACKSLASH__"
-
-                            # First handle double backslashes
-                            quoted_content = quoted_content.replace("\\\\", temp_backslash)
-
-                            # Then handle escaped quotes
-                            quoted_content = quoted_content.replace('\\"', temp_quote)
-
-                            # Finally, restore the original characters with their proper representation
-                            quoted_content = quoted_content.replace(temp_quote, '"')
-                            quoted_content = quoted_content.replace(temp_backslash, '\\')
-
-                            value = quoted_content
-                        elif (value.startswith("'") and value.endswith("'")):
-                            # Simple single quotes without escaping
-                            value = value[1:-1]
-
-                        current_section[key] = value
-
-                    continue
-
-            # Handle "unset" statements
-            if line.startswith('unset '):
-                key_match = re.match(r'unset\s+([^\s]+)', line)
-                if key_match:
-                    key = key_match.group(1)
-                    current_section[key] = None
-                    i += 1
-                    continue
-
-            # Handle "next" - go up one level
-            if line == 'next':
-                section_stack.pop()  # Remove current section
-                if section_stack:  # Ensure the stack is not empty
-                    current_section = section_stack[-1]  # Set current to parent
-                i += 1
-                continue
+        Accessors such as to_json() and get_section() only parse once per
+        instance; after invalidate() the next one parses config_text again,
+        e.g. after it has been replaced.
+        """
+        self.config_json = {}
+        self._parsed = False
 
-            # Handle "end" - go back up the config hierarchy
-            if line == 'end':
-                # Go back up to the previous config level
-                if path_stack:
-                    path_stack.pop()  # Remove last path segment
-
-                # Reset current section to appropriate level
-                section_stack.pop()  # Remove current section
-                if section_stack:  # Ensure the stack is not empty
-                    current_section = section_stack[-1]
-                i += 1
-                continue
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Discard all cached parse results.
 
-            # Default case - just move to next line
-            i += 1
-        return self.config_json
+        parse(cache=True) and parse_file() reuse earlier results for the
+        same text or unchanged file; clear the cache to force a fresh parse
+        and free the memory it holds.
+        """
+        _parse_text_cached.cache_clear()
+        _parse_file_cached.cache_clear()
 
     def to_json(self, indent: int = 2) -> str:
         """
         Convert the parsed configuration to a JSON string.
 
+        orjson is used when installed, but the string is the same as from
+        json.dumps(): non-ASCII characters are \\u-escaped (ensure_ascii).
+
         Args:
             indent: Number of spaces for indentation (default: 2)
 
         Returns:
             JSON string representation of the configuration
         """
-        if not self.config_json:
+        if not self._parsed:
             self.parse()
 
+        data = _orjson_dumps(self.config_json, indent)
+        if data is not None:
+            return data.decode('utf-8')
+
         return json.dumps(self.config_json, indent=indent)
 
     def save_json(self, output_file: str, indent: int = 2) -> None:
         """
         Save the parsed configuration to a JSON file.
 
+        orjson is used when installed, but the file is the same as with the
+        json module: non-ASCII characters are \\u-escaped (ensure_ascii).
+
         Args:
             output_file: Path to output JSON file
             indent: Number of spaces for indentation (default: 2)
         """
-        if not self.config_json:
+        if not self._parsed:
             self.parse()
 
+        data = _orjson_dumps(self.config_json, indent)
+        if data is not None:
+            with open(output_file, 'wb') as f:
+                f.write(data)
+            return
+
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(self.config_json, f, indent=indent)
 
@@ -251,7 +601,7 @@ class FortiParser:
         Returns:
             The requested section, or None if not found
         """
-        if not self.config_json:
+        if not self._parsed:
             self.parse()
 
         current = self.config_json
@@ -263,6 +613,84 @@ class FortiParser:
 
         return current
 
+    def _edit_entries(self, *path: str) -> Dict[str, Any]:
+        """
+        Get the edit entries of a section.
+
+        Args:
+            *path: Path to the section, as a sequence of keys
+
+        Returns:
+            The section's "edit" dict, or an empty dict if there is none
+        """
+        section = self.get_section(*path)
+        if not section or "edit" not in section:
+            return {}
+        return section["edit"]
+
+    def iter_policies(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the firewall policies one at a time.
+
+        Yields:
+            A dict per policy with its "id" followed by the policy settings
+        """
+        for policy_id, policy_data in self._edit_entries("firewall", "policy").items():
+            yield {"id": policy_id, **policy_data}
+
+    def iter_interfaces(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the system interfaces one at a time.
+
+        Yields:
+            A dict per interface with its "name" followed by the interface settings
+        """
+        for name, interface_data in self._edit_entries("system", "interface").items():
+            yield {"name": name, **interface_data}
+
+    def policies_columnar(self) -> Dict[str, List[Any]]:
+        """
+        Get the firewall policies as columns, one list per setting.
+
+        Suited to building a table in one go, e.g. pandas.DataFrame(columns).
+
+        Returns:
+            Dict mapping "id" and every policy setting to a list with one
+            value per policy, in policy order; None where a policy does not
+            have the setting
+        """
+        policies = self._edit_entries("firewall", "policy")
+        count = len(policies)
+
+        # Columns are preallocated on first sight of a setting and filled by
+        # row index, so policies missing a setting are left as None
+        columns: Dict[str, List[Any]] = {"id": list(policies)}
+        for row, policy_data in enumerate(policies.values()):
+            for key, value in policy_data.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * count
+                column[row] = value
+        return columns
+
+    def extract_policies(self) -> List[Dict[str, Any]]:
+        """
+        Extract the firewall policies as a list.
+
+        Returns:
+            List of policy dicts, see iter_policies()
+        """
+        return list(self.iter_policies())
+
+    def extract_interfaces(self) -> List[Dict[str, Any]]:
+        """
+        Extract the system interfaces as a list.
+
+        Returns:
+            List of interface dicts, see iter_interfaces()
+        """
+        return list(self.iter_interfaces())
+
 
 def parse_file(filename: str) -> Dict[str, Any]:
     """
@@ -274,8 +702,80 @@ def parse_file(filename: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing parsed configuration
     """
-    parser = FortiParser(config_file=filename)
-    return parser.parse()
+    # Repeat calls for an unchanged file reuse the cached parse; each caller
+    # still gets its own copy to modify
+    st = os.stat(filename)
+    return _copy_tree(_parse_file_cached(os.path.abspath(filename), st.st_mtime_ns, st.st_size))
+
+
+def parse_files(
+    filenames: Iterable[str], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse several FortiGate configuration files.
+
+    Files are handled on a thread pool so that reading one file overlaps
+    with parsing another; each goes through parse_file() and its cache.
+
+    Args:
+        filenames: Paths to the FortiGate configuration files
+        max_workers: Maximum number of threads (default: as for
+            concurrent.futures.ThreadPoolExecutor)
+
+    Returns:
+        List of parsed configuration dictionaries, in the order given
+    """
+    filenames = list(filenames)
+    if len(filenames) < 2:
+        return [parse_file(filename) for filename in filenames]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_file, filenames))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_file_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file, cached by path, modification time and size.
+
+    Args:
+        path: Absolute path to the FortiGate configuration file
+        mtime_ns: File modification time, part of the cache key only
+        size: File size in bytes, part of the cache key only
+
+    Returns:
+        The parsed configuration; shared between calls, so never modify it
+    """
+    return _parse_config_text(_read_config_file(path))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_text_cached(config_text: str) -> Dict[str, Any]:
+    """
+    Parse configuration text, cached by the text itself.
+
+    Args:
+        config_text: String containing FortiGate configuration
+
+    Returns:
+        The parsed configuration; shared between calls, so never modify it
+    """
+    return _parse_config_text(config_text)
+
+
+def _parse_config_text(config_text: str) -> Dict[str, Any]:
+    """
+    Parse configuration text in this process, without any caching.
+
+    Args:
+        config_text: String containing FortiGate configuration
+
+    Returns:
+        Dictionary containing parsed configuration
+    """
+    config_json: Dict[str, Any] = {}
+    _parse_into(config_text, config_json)
+    return config_json
 
 
 def parse_text(config_text: str) -> Dict[str, Any]:
@@ -295,7 +795,6 @@ def parse_text(config_text: str) -> Dict[str, Any]:
 def main():
     """Main entry point for the command-line interface."""
     import argparse
-    import sys
 
     arg_parser = argparse.ArgumentParser(description='Parse FortiGate configuration files to JSON')
     arg_parser.add_argument('input_file', help='FortiGate configuration file to parse')
@@ -312,7 +811,17 @@ def main():
             parser.save_json(args.output, args.indent)
             print(f"Configuration saved to {args.output}")
         else:
-            print(parser.to_json(args.indent))
+            # Write orjson's bytes straight to stdout when it is a real stream
+            data = _orjson_dumps(parser.config_json, args.indent)
+            stdout = getattr(sys.stdout, 'buffer', None)
+            if data is not None and stdout is not None:
+                sys.stdout.flush()
+                # Two writes, so the output is not copied just to add a newline
+                stdout.write(data)
+                stdout.write(b"\n")
+                stdout.flush()
+            else:
+                print(parser.to_json(args.indent))
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
@@ -3,6 +3,7 @@ Advanced tests for FortiParse with more complex configurations.
 """
 
 import json
+from unittest.mock import patch
 
 from fortiparse import FortiParser
 
@@ -297,6 +298,39 @@ class TestAdvancedParsing:
         # Check the password field is preserved
         assert admin_section["password"] == "ENC SH2/15tGAUKCPmQxglzmAKSQlpekOc5pLcLA5DzZKZtF9S77xCRIMpqkO1HQWA="
 
+    def test_to_json_indents_agree(self):
+        """Test JSON output matches json.dumps() exactly, with or without orjson."""
+        non_ascii = 'config system global\n    set alias "café"\nend\n'
+        for config_text in (COMPLEX_CONFIG, COMPLEX_CONFIG + non_ascii):
+            parser = FortiParser(config_text=config_text)
+            config = parser.parse()
+
+            for indent in (None, 2, 4):
+                expected = json.dumps(config, indent=indent)
+                assert parser.to_json(indent) == expected
+                with patch("fortiparse.fortiparse._HAS_ORJSON", False):
+                    assert parser.to_json(indent) == expected
+
+    def test_to_json_falls_back_when_orjson_fails(self, tmpdir):
+        """Test data orjson cannot encode is written by the json module instead."""
+        deep = FortiParser(config_text="config a\n" * 300 + "end\n" * 300)
+        surrogate = FortiParser(config_text='config system global\n    set x "\ud800"\nend\n')
+        int_key = FortiParser(config_text=COMPLEX_CONFIG)
+
+        for parser in (deep, surrogate, int_key):
+            parser.parse()
+        # Callers may edit the parsed config, e.g. adding an int key and value
+        int_key.config_json[1] = 2 ** 70
+
+        for parser in (deep, surrogate, int_key):
+            expected = json.dumps(parser.config_json, indent=2)
+            assert parser.to_json() == expected
+
+            output_file = str(tmpdir.join("output.json"))
+            parser.save_json(output_file)
+            with open(output_file, 'r', encoding='utf-8') as f:
+                assert f.read() == expected
+
     def test_multiline_comment_parsing(self):
         """Test parsing of multiline comments in FortiGate configurations."""
         parser = FortiParser(config_text=MULTI_LINE_COMMENTS_CONFIG)
@@ -322,3 +356,34 @@ class TestAdvancedParsing:
         # Also verify another address object with a single-line comment
         assert "DMZ-NET" in addresses
         assert addresses["DMZ-NET"]["comment"] == "YYYYMMDD - XXX - TICKETXXX - Description"
+
+    def test_unbalanced_end_statements(self):
+        """Test that stray next/end lines at the top level are ignored."""
+        parser = FortiParser(config_text=(
+            "config system global\nend\n"
+            "end\nnext\n"
+            "set hostname \"FG\"\n"
+        ))
+        config = parser.parse()
+
+        assert config["system"]["global"] == {}
+        assert config["hostname"] == "FG"
+
+    def test_parallel_parse_matches_serial(self):
+        """Test that parsing top-level blocks in worker processes gives the same result."""
+        config_text = COMPLEX_CONFIG + UNSET_CONFIG + MULTI_LINE_COMMENTS_CONFIG
+
+        serial = FortiParser(config_text=config_text).parse()
+        parallel = FortiParser(config_text=config_text).parse(processes=2)
+
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+
+    def test_parallel_parse_unbalanced_falls_back(self):
+        """Test that a config that does not split into complete blocks is parsed serially."""
+        config_text = UNSET_CONFIG + "end\nset hostname \"FG\"\n" + COMPLEX_CONFIG
+
+        serial = FortiParser(config_text=config_text).parse()
+        parallel = FortiParser(config_text=config_text).parse(processes=3)
+
+        assert parallel == serial
@@ -6,7 +6,8 @@ import os
 import json
 import tempfile
 import pytest
-from fortiparse import FortiParser, parse_file, parse_text
+from unittest.mock import patch
+from fortiparse import FortiParser, parse_file, parse_files, parse_text
 
 
 # Sample FortiGate configuration for testing
@@ -196,6 +197,19 @@ class TestFortiParser:
         assert isinstance(json_obj, dict)
         assert "system" in json_obj
         assert "firewall" in json_obj
+
+    def test_save_json_non_ascii(self, tmpdir):
+        """Test non-ASCII values are saved escaped, exactly as json.dump() writes them."""
+        output_file = os.path.join(tmpdir, "output.json")
+
+        parser = FortiParser(config_text='config system global\n    set alias "café ✓"\nend\n')
+        parser.save_json(output_file)
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        assert content == json.dumps(parser.config_json, indent=2)
+        assert '"alias": "caf\\u00e9 \\u2713"' in content
     
     def test_get_section(self):
         """Test getting specific section."""
@@ -212,31 +226,110 @@ class TestFortiParser:
         nonexistent = parser.get_section("system", "nonexistent")
         assert nonexistent is None
     
-    # def test_extract_policies(self):
-    #     """Test extracting firewall policies."""
-    #     parser = FortiParser(config_text=SAMPLE_CONFIG)
-    #     parser.parse()
-    #
-    #     policies = parser.extract_policies()
-    #
-    #     assert len(policies) == 2
-    #     assert policies[0]["id"] == "1"
-    #     assert policies[0]["srcintf"] == 'port5'
-    #     assert policies[1]["id"] == "2"
-    #     assert policies[1]["dstintf"] == 'port2'
-    #
-    # def test_extract_interfaces(self):
-    #     """Test extracting interfaces."""
-    #     parser = FortiParser(config_text=SAMPLE_CONFIG)
-    #     parser.parse()
-    #
-    #     interfaces = parser.extract_interfaces()
-    #
-    #     assert len(interfaces) == 2
-    #     assert interfaces[0]["name"] == "port1"
-    #     assert interfaces[0]["vdom"] == 'root'
-    #     assert interfaces[1]["name"] == "port2"
-    #     assert interfaces[1]["ip"] == "100.100.101.101 255.255.255.0"
+    def test_get_section_sees_changes(self):
+        """Test get_section reflects changes made to config_json."""
+        parser = FortiParser(config_text=SAMPLE_CONFIG)
+        assert parser.get_section("system", "global", "hostname") == "Branch1"
+
+        parser.config_json["system"]["global"]["hostname"] = "Changed"
+        assert parser.get_section("system", "global", "hostname") == "Changed"
+
+        parser.config_json["system"]["interface"] = {"edit": {}}
+        assert parser.extract_interfaces() == []
+
+    def test_empty_config_parsed_once(self):
+        """Test accessors do not re-parse a config that parsed to nothing."""
+        parser = FortiParser(config_text="")
+        assert parser.parse() == {}
+
+        with patch.object(FortiParser, "parse", wraps=parser.parse) as mock_parse:
+            assert parser.to_json() == "{}"
+            assert parser.get_section("system") is None
+            mock_parse.assert_not_called()
+
+    def test_invalidate(self):
+        """Test accessors parse again after invalidate()."""
+        parser = FortiParser(config_text=SAMPLE_CONFIG)
+        assert parser.get_section("system", "global", "hostname") == "Branch1"
+
+        parser.config_text = SAMPLE_CONFIG.replace("Branch1", "Branch2")
+        assert parser.get_section("system", "global", "hostname") == "Branch1"
+
+        parser.invalidate()
+        assert parser.get_section("system", "global", "hostname") == "Branch2"
+
+    def test_parse_cached_across_instances(self):
+        """Test repeated cached parses of the same text return independent copies."""
+        first = FortiParser(config_text=SAMPLE_CONFIG).parse(cache=True)
+        first["system"]["global"]["hostname"] = "Changed"
+
+        second = FortiParser(config_text=SAMPLE_CONFIG).parse(cache=True)
+        assert second["system"]["global"]["hostname"] == 'Branch1'
+        assert second is not first
+
+        FortiParser.clear_cache()
+        assert FortiParser(config_text=SAMPLE_CONFIG).parse(cache=True) == second
+
+    def test_parse_uncached_by_default(self):
+        """Test a plain parse() does not touch the parse cache."""
+        with patch("fortiparse.fortiparse._parse_text_cached") as mock_cached:
+            config = FortiParser(config_text=SAMPLE_CONFIG).parse()
+            mock_cached.assert_not_called()
+
+        assert config["system"]["global"]["hostname"] == 'Branch1'
+
+    def test_extract_policies(self):
+        """Test extracting firewall policies."""
+        parser = FortiParser(config_text=SAMPLE_CONFIG)
+        parser.parse()
+
+        policies = parser.extract_policies()
+
+        assert len(policies) == 2
+        assert policies[0]["id"] == "1"
+        assert policies[0]["srcintf"] == 'port5'
+        assert policies[1]["id"] == "2"
+        assert policies[1]["dstintf"] == 'port2'
+
+    def test_extract_interfaces(self):
+        """Test extracting interfaces."""
+        parser = FortiParser(config_text=SAMPLE_CONFIG)
+        parser.parse()
+
+        interfaces = parser.extract_interfaces()
+
+        assert len(interfaces) == 2
+        assert interfaces[0]["name"] == "port1"
+        assert interfaces[0]["vdom"] == 'root'
+        assert interfaces[1]["name"] == "port2"
+        assert interfaces[1]["ip"] == "100.100.101.101 255.255.255.0"
+
+    def test_iter_policies(self):
+        """Test lazily iterating firewall policies."""
+        parser = FortiParser(config_text=SAMPLE_CONFIG)
+        parser.parse()
+
+        policies = parser.iter_policies()
+        first = next(policies)
+        assert first["id"] == "1"
+        assert first["action"] == "accept"
+        assert [policy["id"] for policy in policies] == ["2"]
+
+        # Sections that are missing simply yield nothing
+        assert list(FortiParser(config_text="config system global\nend\n").iter_interfaces()) == []
+
+    def test_policies_columnar(self):
+        """Test firewall policies as one list per setting."""
+        # Drop the last policy's logtraffic setting
+        config_text = SAMPLE_CONFIG.replace(
+            "        set logtraffic all\n    next\nend", "    next\nend")
+        columns = FortiParser(config_text=config_text).policies_columnar()
+
+        assert columns["id"] == ["1", "2"]
+        assert columns["dstintf"] == ["port1", "port2"]
+        assert columns["service"] == ["ALL", ["HTTP", "HTTPS"]]
+        # A setting missing from a policy is None in that policy's row
+        assert columns["logtraffic"] == ["all", None]
 
 
 def test_parse_file_function(sample_config_file):
@@ -248,6 +341,55 @@ def test_parse_file_function(sample_config_file):
     assert config["system"]["global"]["hostname"] == 'Branch1'
 
 
+def test_parse_file_empty(tmpdir):
+    """Test an empty file, which cannot be memory-mapped, parses to nothing."""
+    empty_file = tmpdir.join("empty.conf")
+    empty_file.write("")
+
+    assert FortiParser(config_file=str(empty_file)).config_text == ""
+    assert parse_file(str(empty_file)) == {}
+
+
+def test_parse_file_line_endings(tmpdir):
+    """Test CRLF and CR line endings are read as plain newlines."""
+    for newline in ("\r\n", "\r"):
+        config_file = tmpdir.join("newlines.conf")
+        config_file.write_binary(SAMPLE_CONFIG.replace("\n", newline).encode("utf-8"))
+
+        parser = FortiParser(config_file=str(config_file))
+        assert parser.config_text == SAMPLE_CONFIG
+        assert parser.parse() == parse_text(SAMPLE_CONFIG)
+
+
+def test_parse_file_cached(sample_config_file):
+    """Test parse_file reuses its parse but hands out independent copies."""
+    first = parse_file(sample_config_file)
+    first["system"]["global"]["hostname"] = "Changed"
+
+    second = parse_file(sample_config_file)
+    assert second["system"]["global"]["hostname"] == 'Branch1'
+    assert second is not first
+
+    # Rewriting the file invalidates the cached parse
+    with open(sample_config_file, 'w') as f:
+        f.write(SAMPLE_CONFIG.replace('"Branch1"', '"Branch10"'))
+
+    third = parse_file(sample_config_file)
+    assert third["system"]["global"]["hostname"] == 'Branch10'
+
+
+def test_parse_files_function(sample_config_file, tmpdir):
+    """Test parse_files returns one config per file, in order."""
+    other_file = tmpdir.join("other.conf")
+    other_file.write("config system global\n    set hostname \"Other\"\nend\n")
+
+    configs = parse_files([sample_config_file, str(other_file), sample_config_file])
+
+    hostnames = [config["system"]["global"]["hostname"] for config in configs]
+    assert hostnames == ["Branch1", "Other", "Branch1"]
+    assert configs[0] is not configs[2]
+
+
 def test_parse_text_function():
     """Test parse_text utility function."""
     config = parse_text(SAMPLE_CONFIG)